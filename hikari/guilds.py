@@ -60,7 +60,6 @@ import attr
 
 from hikari import channels as channels_
 from hikari import snowflakes
-from hikari import stickers
 from hikari import traits
 from hikari import undefined
 from hikari import urls
@@ -81,6 +80,7 @@ if typing.TYPE_CHECKING:
     from hikari import locales
     from hikari import permissions as permissions_
     from hikari import presences as presences_
+    from hikari import stickers
     from hikari import voices as voices_
 
 
@@ -188,6 +188,7 @@ __all__: typing.Sequence[str] = ("UNKNOWN_HASH", "RESTBucket", "RESTBucketManage
 
 import asyncio
 import logging
+import sys
 import typing
 
 from hikari import errors
@@ -469,7 +470,12 @@ class RESTBucketManager:
         assert self._closed_event is not None
         while not self._closed_event.is_set():
             try:
-                await asyncio.wait_for(self._closed_event.wait(), timeout=poll_period)
+                if sys.version_info >= (3, 11):
+                    # asyncio.timeout avoids wrapping the wait in a new task on every poll
+                    async with asyncio.timeout(poll_period):
+                        await self._closed_event.wait()
+                else:
+                    await asyncio.wait_for(self._closed_event.wait(), timeout=poll_period)
             except asyncio.TimeoutError:
                 _LOGGER.log(ux.TRACE, "performing rate limit garbage collection pass")
                 self._purge_stale_buckets(expire_after)
@@ -27,6 +27,7 @@ from __future__ import annotations
 __all__: typing.Sequence[str] = ("EntityFactoryImpl",)
 
 import datetime
+import functools
 import logging
 import typing
 
@@ -84,6 +85,13 @@ _interaction_option_type_mapping: typing.Dict[int, typing.Callable[[typing.Any],
 }
 
 
+# Colors are immutable and most guilds only use a handful of distinct role colors,
+# so we share instances rather than validating and allocating a new one per role.
+_deserialize_role_color: typing.Callable[[int], color_models.Color] = functools.lru_cache(maxsize=1024)(
+    color_models.Color
+)
+
+
 def _with_int_cast(cast: typing.Callable[[int], ValueT]) -> typing.Callable[[typing.Any], ValueT]:
     """Wrap a cast to ensure the value passed to it will first be cast to int."""
     return lambda value: cast(int(value))
@@ -375,10 +383,10 @@ class _GatewayGuildDefinition(entity_factory.GatewayGuildDefinition):
 
     def roles(self) -> typing.Mapping[snowflakes.Snowflake, guild_models.Role]:
         if self._roles is undefined.UNDEFINED:
-            self._roles = {
-                snowflakes.Snowflake(r["id"]): self._entity_factory.deserialize_role(r, guild_id=self.id)
-                for r in self._payload["roles"]
-            }
+            roles_iter = (
+                self._entity_factory.deserialize_role(role, guild_id=self.id) for role in self._payload["roles"]
+            )
+            self._roles = {r.id: r for r in roles_iter}
 
         return self._roles
 
@@ -584,7 +592,7 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
             name=payload["name"],
             icon_hash=payload["icon"],
             features=[guild_models.GuildFeature(feature) for feature in payload["features"]],
-            is_owner=bool(payload["owner"]),
+            is_owner=payload["owner"],
             my_permissions=permission_models.Permissions(int(payload["permissions"])),
         )
 
@@ -1774,12 +1782,12 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
         bot_id: typing.Optional[snowflakes.Snowflake] = None
         integration_id: typing.Optional[snowflakes.Snowflake] = None
         is_premium_subscriber_role: bool = False
-        if "tags" in payload:
-            tags_payload = payload["tags"]
-            if "bot_id" in tags_payload:
-                bot_id = snowflakes.Snowflake(tags_payload["bot_id"])
-            if "integration_id" in tags_payload:
-                integration_id = snowflakes.Snowflake(tags_payload["integration_id"])
+        if (tags_payload := payload.get("tags")) is not None:
+            if (raw_bot_id := tags_payload.get("bot_id")) is not None:
+                bot_id = snowflakes.Snowflake(raw_bot_id)
+            if (raw_integration_id := tags_payload.get("integration_id")) is not None:
+                integration_id = snowflakes.Snowflake(raw_integration_id)
+            # This is always null, its presence is what marks the premium subscriber role.
             if "premium_subscriber" in tags_payload:
                 is_premium_subscriber_role = True
 
@@ -1792,7 +1800,7 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
             id=snowflakes.Snowflake(payload["id"]),
             guild_id=guild_id,
             name=payload["name"],
-            color=color_models.Color(payload["color"]),
+            color=_deserialize_role_color(payload["color"]),
             is_hoisted=payload["hoist"],
             icon_hash=payload.get("icon"),
             unicode_emoji=emoji,
@@ -1925,10 +1933,8 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
         raw_max_presences = payload["max_presences"]
         max_presences = int(raw_max_presences) if raw_max_presences is not None else None
 
-        roles = {
-            snowflakes.Snowflake(role["id"]): self.deserialize_role(role, guild_id=guild_fields.id)
-            for role in payload["roles"]
-        }
+        roles_iter = (self.deserialize_role(role, guild_id=guild_fields.id) for role in payload["roles"])
+        roles = {r.id: r for r in roles_iter}
         emojis = {
             snowflakes.Snowflake(emoji["id"]): self.deserialize_known_custom_emoji(emoji, guild_id=guild_fields.id)
             for emoji in payload["emojis"]
@@ -3343,7 +3349,7 @@ class EntityFactoryImpl(entity_factory.EntityFactory):
                 id=snowflakes.Snowflake(role_payload["id"]),
                 name=role_payload["name"],
                 permissions=permission_models.Permissions(int(role_payload["permissions"])),
-                color=color_models.Color(role_payload["color"]),
+                color=_deserialize_role_color(role_payload["color"]),
                 is_hoisted=role_payload["hoist"],
                 is_mentionable=role_payload["mentionable"],
             )
@@ -39,6 +39,7 @@ __all__: typing.Sequence[str] = (
 )
 
 import datetime
+import sys
 import time
 import typing
 import uuid as uuid_
@@ -64,6 +65,14 @@ References
 """
 
 
+if sys.version_info >= (3, 11):
+    # Python 3.11's parser handles "Z" itself, so we only need to rewrite the
+    # lower-case zulu time that RFC-3339 also allows.
+    _ZULU_SUFFIXES: typing.Final[typing.Tuple[str, ...]] = ("z",)
+else:
+    _ZULU_SUFFIXES: typing.Final[typing.Tuple[str, ...]] = ("z", "Z")
+
+
 # Default to the standard lib parser, that isn't really ISO compliant but seems
 # to work for what we need.
 def slow_iso8601_datetime_string_to_datetime(datetime_str: str) -> datetime.datetime:
@@ -79,8 +88,8 @@ def slow_iso8601_datetime_string_to_datetime(datetime_str: str) -> datetime.date
     datetime.datetime
         The corresponding date time.
     """
-    if datetime_str.endswith(("z", "Z")):
-        # Python's parser cannot handle zulu time, it isn't a proper ISO-8601 compliant parser.
+    if datetime_str.endswith(_ZULU_SUFFIXES):
+        # Python's parser cannot handle (all forms of) zulu time, it isn't a proper ISO-8601 compliant parser.
         datetime_str = f"{datetime_str[:-1]}+00:00"
     return datetime.datetime.fromisoformat(datetime_str)
 
@@ -208,12 +208,11 @@ class TestRESTBucketManager:
         class ExitError(Exception):
             ...
 
-        bucket_manager._closed_event.wait = mock.Mock()
+        bucket_manager._closed_event.wait = mock.AsyncMock(side_effect=[asyncio.TimeoutError, ExitError])
 
         with mock.patch.object(buckets.RESTBucketManager, "_purge_stale_buckets") as purge_stale_buckets:
-            with mock.patch.object(asyncio, "wait_for", side_effect=[asyncio.TimeoutError, ExitError]):
-                with pytest.raises(ExitError):
-                    await bucket_manager._gc(0.001, 33)
+            with pytest.raises(ExitError):
+                await bucket_manager._gc(0.001, 33)
 
         purge_stale_buckets.assert_called_with(33)
 
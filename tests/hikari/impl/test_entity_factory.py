@@ -3224,6 +3224,14 @@ class TestEntityFactoryImpl:
         assert guild_role.integration_id is None
         assert guild_role.is_premium_subscriber_role is False
 
+    def test_deserialize_role_shares_color_instances(self, entity_factory_impl, guild_role_payload):
+        guild_id = snowflakes.Snowflake(76534453)
+        first_role = entity_factory_impl.deserialize_role(guild_role_payload, guild_id=guild_id)
+        second_role = entity_factory_impl.deserialize_role(guild_role_payload, guild_id=guild_id)
+
+        assert isinstance(first_role.color, color_models.Color)
+        assert first_role.color is second_role.color
+
     def test_deserialize_partial_integration(self, entity_factory_impl, partial_integration_payload):
         partial_integration = entity_factory_impl.deserialize_partial_integration(partial_integration_payload)
         assert partial_integration.id == 4949494949
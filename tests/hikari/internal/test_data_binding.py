@@ -37,6 +37,32 @@ class MyUnique(snowflakes.Unique):
     id: snowflakes.Snowflake = attr.field(converter=snowflakes.Snowflake)
 
 
+def test_load_json_uses_orjson_when_available():
+    orjson = pytest.importorskip("orjson")
+
+    with mock.patch.object(orjson, "loads") as loads:
+        assert data_binding.load_json('{"a": 1}') is loads.return_value
+
+    loads.assert_called_once_with('{"a": 1}')
+
+
+@pytest.mark.parametrize(
+    ("json_str", "expected"),
+    [
+        ('{"a": "\\ud800"}', {"a": "\ud800"}),
+        (b'{"a": "\\ud800"}', {"a": "\ud800"}),
+        ("[1, Infinity]", [1, float("inf")]),
+    ],
+)
+def test_load_json_accepts_input_rejected_by_orjson(json_str, expected):
+    assert data_binding.load_json(json_str) == expected
+
+
+def test_load_json_errors_are_json_decode_errors():
+    with pytest.raises(data_binding.JSONDecodeError):
+        data_binding.load_json("{invalid")
+
+
 class TestURLEncodedFormBuilder:
     @pytest.fixture()
     def form_builder(self):
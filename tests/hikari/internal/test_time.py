@@ -93,6 +93,13 @@ def test_parse_iso_8601_date_with_no_fraction():
     assert date.microsecond == 0
 
 
+@pytest.mark.parametrize("string", ["2019-10-10T05:22:33.023Z", "2019-10-10T05:22:33.023z"])
+def test_slow_parse_iso_8601_date_with_zulu(string):
+    date = time.slow_iso8601_datetime_string_to_datetime(string)
+
+    assert date == datetime.datetime(2019, 10, 10, 5, 22, 33, 23000, tzinfo=datetime.timezone.utc)
+
+
 def test_speedup_replaces_python_version_when_available():
     try:
         import ciso8601